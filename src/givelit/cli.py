@@ -7,6 +7,7 @@ from __future__ import annotations
 import asyncio
 from datetime import UTC, datetime
 from enum import Enum
+from operator import itemgetter
 from pathlib import Path
 import os
 import sys
@@ -23,11 +24,18 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from .fetcher import EuropePMCFetchResult, EuropePMCFetcher, USER_AGENT
-from .journals import DEFAULT_JOURNALS, PREPRINT_JOURNALS, resolve_journals
+from .fetcher import (
+    EuropePMCFetchResult,
+    EuropePMCFetcher,
+    ResponseCache,
+    batch_journals,
+    create_client,
+    default_cache_dir,
+)
+from .journals import canonical_lookup, resolve_journals
 from .models import JournalConfig, Paper
-from .relevance import compute_relevance
-from .reporting import render_cli_report, write_html_report
+from .relevance import normalise_keywords, score_papers
+from .reporting import build_report_model, render_cli_report, write_html_report
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 
@@ -83,18 +91,13 @@ def _normalise_keywords(keywords: Sequence[str]) -> List[str]:
     return cleaned
 
 
-def _sort_papers(papers: List[Paper], strategy: SortStrategy) -> List[Paper]:
-    def age_value(paper: Paper) -> int:
-        return paper.age_days if paper.age_days is not None else 10**6
-
-    if strategy is SortStrategy.SCORE:
-        key = lambda p: (-p.relevance, age_value(p), p.title.lower())
-    elif strategy is SortStrategy.RECENCY:
-        key = lambda p: (age_value(p), -p.relevance, p.title.lower())
-    else:  # SortStrategy.JOURNAL
-        key = lambda p: (p.journal.lower(), -p.relevance, age_value(p))
-
-    return sorted(papers, key=key)
+_SORT_FIELDS = {
+    # positions in the rows built by _order_papers: -score, age, title, journal
+    SortStrategy.SCORE: (0, 1, 2),
+    SortStrategy.RECENCY: (1, 0, 2),
+    SortStrategy.JOURNAL: (3, 0, 1),
+}
+_COVERAGE_ORDER = ("full", "near", "partial", "single")
 
 
 def _coverage_level(paper: Paper, total_keywords: int) -> str:
@@ -112,12 +115,35 @@ def _coverage_level(paper: Paper, total_keywords: int) -> str:
     return "single"
 
 
-def _bucket_by_coverage(papers: List[Paper], total_keywords: int) -> dict[str, List[Paper]]:
-    buckets = {"full": [], "near": [], "partial": [], "single": []}
-    for paper in papers:
-        level = _coverage_level(paper, total_keywords)
-        buckets.setdefault(level, []).append(paper)
-    return {level: buckets[level] for level in ["full", "near", "partial", "single"] if buckets.get(level)}
+def _order_papers(
+    papers: List[Paper],
+    strategy: SortStrategy,
+    total_keywords: int,
+) -> tuple[List[Paper], dict[str, List[Paper]]]:
+    """
+    Sort papers for the chosen strategy and bucket the ordered papers by
+    coverage level, computing every sort key and level once per paper.
+    """
+
+    rows = [
+        (
+            -paper.relevance,
+            paper.age_days if paper.age_days is not None else 10**6,
+            paper.title.lower(),
+            paper.journal.lower(),
+            _coverage_level(paper, total_keywords),
+            paper,
+        )
+        for paper in papers
+    ]
+    rows.sort(key=itemgetter(*_SORT_FIELDS[strategy]))
+
+    ordered: List[Paper] = []
+    buckets: dict[str, List[Paper]] = {level: [] for level in _COVERAGE_ORDER}
+    for *_, level, paper in rows:
+        ordered.append(paper)
+        buckets[level].append(paper)
+    return ordered, {level: bucket for level, bucket in buckets.items() if bucket}
 
 
 async def _fetch_with_progress(
@@ -127,10 +153,7 @@ async def _fetch_with_progress(
     days: int,
     max_results: int,
 ) -> List[EuropePMCFetchResult]:
-    async with httpx.AsyncClient(
-        timeout=fetcher.timeout,
-        headers={"User-Agent": USER_AGENT},
-    ) as client:
+    async with create_client(fetcher.timeout) as client:
         progress = Progress(
             SpinnerColumn(style="green"),
             TextColumn("{task.description}", justify="left"),
@@ -141,23 +164,23 @@ async def _fetch_with_progress(
             console=console,
         )
 
-        async def run_for_journal(journal: JournalConfig) -> EuropePMCFetchResult:
-            return await fetcher.fetch_for_journal(
-                client, journal, keywords, days, max_results
+        async def run_for_batch(batch: List[JournalConfig]) -> List[EuropePMCFetchResult]:
+            return await fetcher.fetch_for_journal_batch(
+                client, batch, keywords, days, max_results
             )
 
-        tasks = [asyncio.create_task(run_for_journal(journal)) for journal in journals]
+        tasks = [asyncio.create_task(run_for_batch(batch)) for batch in batch_journals(journals)]
 
         combined: List[EuropePMCFetchResult] = []
         with progress:
-            task_id = progress.add_task("Querying Europe PMC…", total=len(tasks))
+            task_id = progress.add_task("Querying Europe PMC…", total=len(journals))
             for coro in asyncio.as_completed(tasks):
-                result = await coro
-                combined.append(result)
+                results = await coro
+                combined.extend(results)
                 progress.update(
                     task_id,
-                    advance=1,
-                    description=f"{result.journal.name} ✓",
+                    advance=len(results),
+                    description=f"{results[-1].journal.name} ✓",
                 )
         return combined
 
@@ -230,6 +253,22 @@ def radar(
         "--include-preprints",
         help="Add arXiv and bioRxiv to the selected journals (including --journal all).",
     ),
+    merge_coverage: bool = typer.Option(
+        False,
+        "--merge-coverage",
+        help="With --coverage all, show one table and summary instead of one per coverage level.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always query Europe PMC instead of reusing responses cached in the last 6 hours.",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        min=1,
+        help="Worker processes used to score papers (1 scores in-process).",
+    ),
 ) -> None:
     """
     Surface the most relevant recent papers for the chosen journals.
@@ -238,21 +277,17 @@ def radar(
     keyword_list = _normalise_keywords(keywords)
     journal_configs = resolve_journals(journals, include_preprints=include_preprints)
     if skip_journals:
+        lookup = canonical_lookup()
         skip_lookup: set[str] = set()
-        canonical = {}
-        for journal in list(DEFAULT_JOURNALS) + list(PREPRINT_JOURNALS):
-            canonical[journal.key.lower()] = journal.name.lower()
-            canonical[journal.name.lower()] = journal.name.lower()
-            canonical[journal.container_title.lower()] = journal.name.lower()
         for token in skip_journals:
             lowered = token.lower()
-            skip_lookup.add(canonical.get(lowered, lowered))
+            journal = lookup.get(lowered)
+            skip_lookup.add(journal.name_lc if journal else lowered)
         filtered = []
         for journal in journal_configs:
-            key = journal.name.lower()
-            if key in skip_lookup:
+            if journal.name_lc in skip_lookup:
                 continue
-            if journal.key.lower() in skip_lookup or journal.container_title.lower() in skip_lookup:
+            if journal.key_lc in skip_lookup or journal.container_title_lc in skip_lookup:
                 continue
             filtered.append(journal)
         journal_configs = filtered
@@ -265,7 +300,8 @@ def radar(
         f"[italic]{', '.join(keyword_list)}[/italic]…"
     )
 
-    fetcher = EuropePMCFetcher(timeout=15.0)
+    cache = None if no_cache else ResponseCache(default_cache_dir())
+    fetcher = EuropePMCFetcher(timeout=15.0, cache=cache)
 
     try:
         journal_chunks = asyncio.run(
@@ -285,8 +321,8 @@ def radar(
 
     now = datetime.now(tz=UTC)
     recency_window = days if days > 0 else 0
-    for paper in papers:
-        compute_relevance(paper, keyword_list, recency_window, reference=now)
+    keyword_lc = normalise_keywords(keyword_list)
+    papers = score_papers(papers, keyword_lc, recency_window, reference=now, jobs=jobs)
 
     filtered: List[Paper] = []
     for paper in papers:
@@ -300,29 +336,29 @@ def radar(
 
     papers = filtered
 
-    ordered = _sort_papers(papers, sort_strategy)
     total_keywords = len(keyword_list)
-    coverage_buckets = _bucket_by_coverage(ordered, total_keywords)
+    ordered, coverage_buckets = _order_papers(papers, sort_strategy, total_keywords)
 
     selected: List[Paper] = []
     if coverage_filter is CoverageFilter.FULL:
         selected = coverage_buckets.get("full", [])[:max_results]
     else:
         # seed with one item from each coverage bucket if available
-        temp_buckets = {level: bucket[:] for level, bucket in coverage_buckets.items()}
-        for level in ["full", "near", "partial", "single"]:
-            bucket = temp_buckets.get(level)
+        picked = [False] * len(ordered)
+        position = {id(paper): index for index, paper in enumerate(ordered)}
+        for level in _COVERAGE_ORDER:
+            bucket = coverage_buckets.get(level)
             if bucket and len(selected) < max_results:
-                selected.append(bucket.pop(0))
+                selected.append(bucket[0])
+                picked[position[id(bucket[0])]] = True
         # fill remaining slots with overall ordering
-        seen = {id(p) for p in selected}
-        for paper in ordered:
+        for index, paper in enumerate(ordered):
             if len(selected) >= max_results:
                 break
-            if id(paper) in seen:
+            if picked[index]:
                 continue
             selected.append(paper)
-            seen.add(id(paper))
+            picked[index] = True
 
     top_papers = selected
 
@@ -337,6 +373,12 @@ def radar(
         "coverage": coverage_filter.value,
     }
 
+    report_model = build_report_model(
+        top_papers,
+        keyword_list,
+        split_by_coverage=not (merge_coverage and coverage_filter is CoverageFilter.ALL),
+    )
+
     if report_format is ReportFormat.CLI:
         render_cli_report(
             console,
@@ -345,6 +387,7 @@ def radar(
             journal_names,
             option_context,
             missing_journals=empty_journals,
+            model=report_model,
         )
     else:
         if output is None:
@@ -365,6 +408,7 @@ def radar(
             output,
             option_context,
             missing_journals=empty_journals,
+            model=report_model,
         )
         console.print(f"[green]Report saved to[/green] {destination}")
 
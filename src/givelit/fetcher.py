@@ -5,25 +5,58 @@ Journal search backed by the Europe PMC REST API.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import html
+import json
+import os
+import re
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import Iterable, List
+from pathlib import Path
+from typing import Iterable, List, Sequence
 
 import httpx
-from bs4 import BeautifulSoup
 
+from .journals import normalise_key
 from .models import JournalConfig, Paper
 
 
 BASE_URL = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
 USER_AGENT = "giveLit/0.2 (+https://github.com/juanvillada/givelit)"
+MAX_PAGE_SIZE = 1000
+JOURNAL_BATCH_SIZE = 8
+MAX_CONNECTIONS = 32
+CONNECT_RETRIES = 2
+CACHE_TTL_SECONDS = 6 * 60 * 60
+
+_TAG_RE = re.compile(r"</?[A-Za-z][^<>]*>")
+_WS_RE = re.compile(r"\s+")
+
+
+def _strip_html_dom(value: str) -> str:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(value, "lxml")
+    return soup.get_text(" ", strip=True)
 
 
 def _strip_html(value: str | None) -> str | None:
+    """
+    Remove inline markup from Europe PMC titles and abstracts.
+    """
+
     if not value:
         return None
-    soup = BeautifulSoup(value, "lxml")
-    cleaned = soup.get_text(" ", strip=True)
+    if "<" not in value and "&" not in value:
+        # plain text: nothing to remove or decode
+        return value.strip() or None
+    stripped = _TAG_RE.sub(" ", value)
+    if "<" in stripped or ">" in stripped:
+        # stray angle brackets: let a real parser decide what is markup
+        cleaned = _strip_html_dom(value)
+    else:
+        cleaned = _WS_RE.sub(" ", html.unescape(stripped)).strip()
     return cleaned or None
 
 
@@ -49,7 +82,7 @@ def _parse_date(raw: str | None) -> datetime | None:
                 return None
 
 
-def _build_query(journal: JournalConfig, keywords: Iterable[str], days_back: int) -> str:
+def _keyword_clause(keywords: Iterable[str]) -> str:
     quoted_terms = []
     for keyword in keywords:
         term = keyword.strip()
@@ -64,23 +97,225 @@ def _build_query(journal: JournalConfig, keywords: Iterable[str], days_back: int
         raise ValueError("At least one keyword is required.")
 
     if len(quoted_terms) == 1:
-        keyword_query = quoted_terms[0]
+        return quoted_terms[0]
+    joined = " OR ".join(quoted_terms)
+    return f"({joined})"
+
+
+def _build_query(
+    journals: JournalConfig | Sequence[JournalConfig],
+    keywords: Iterable[str],
+    days_back: int,
+) -> str:
+    """
+    Build a Europe PMC query for one journal or for a batch of journals that
+    share the same constraint and date fields.
+    """
+
+    if isinstance(journals, JournalConfig):
+        journals = [journals]
+    head = journals[0]
+
+    keyword_query = _keyword_clause(keywords)
+    constraint_field = getattr(head, "constraint_field", "JOURNAL") or "JOURNAL"
+    titles = [f'"{journal.container_title}"' for journal in journals]
+    if len(titles) == 1:
+        journal_clause = f"{constraint_field}:{titles[0]}"
     else:
-        joined = " OR ".join(quoted_terms)
-        keyword_query = f"({joined})"
-    constraint_field = getattr(journal, "constraint_field", "JOURNAL") or "JOURNAL"
-    journal_clause = f'{constraint_field}:"{journal.container_title}"'
+        journal_clause = f"{constraint_field}:({' OR '.join(titles)})"
     segments = [keyword_query, journal_clause]
 
     if days_back > 0:
         end_date = datetime.now(tz=UTC).date()
         start_date = end_date - timedelta(days=days_back)
-        date_field = getattr(journal, "date_field", "FIRST_PDATE") or "FIRST_PDATE"
+        date_field = getattr(head, "date_field", "FIRST_PDATE") or "FIRST_PDATE"
         segments.append(f'{date_field}:[{start_date} TO {end_date}]')
 
     return " ".join(segments)
 
 
+def _page_size(max_results: int) -> int:
+    # two candidates per requested slot, so no fetched record goes unused
+    return max(25, min(max_results * 2, 200))
+
+
+def batch_journals(
+    journals: Iterable[JournalConfig],
+    batch_size: int = JOURNAL_BATCH_SIZE,
+) -> List[List[JournalConfig]]:
+    """
+    Partition journals into batches that can be queried with a single request.
+    Journals are only batched together when they use the same query fields.
+    """
+
+    groups: dict[tuple[str, str], List[JournalConfig]] = {}
+    for journal in journals:
+        groups.setdefault((journal.constraint_field, journal.date_field), []).append(journal)
+    batches: List[List[JournalConfig]] = []
+    for members in groups.values():
+        for start in range(0, len(members), batch_size):
+            batches.append(members[start:start + batch_size])
+    return batches
+
+
+def _record_journal_labels(item: dict) -> List[str]:
+    labels = [item.get("journalTitle")]
+    journal_info = (item.get("journalInfo") or {}).get("journal") or {}
+    labels.extend(
+        journal_info.get(field)
+        for field in ("title", "isoabbreviation", "medlineAbbreviation")
+    )
+    labels.append((item.get("bookOrReportDetails") or {}).get("publisher"))
+    return [label for label in labels if label]
+
+
+def _match_journal(item: dict, lookup: dict[str, JournalConfig]) -> JournalConfig | None:
+    """
+    Pick the batch journal a record belongs to. An exact match on any journal
+    label wins; otherwise the longest journal key contained in a label is used,
+    so a "Nature Communications" record returned for ``JOURNAL:"Nature"`` is
+    filed under Nature just as a single-journal query would have done.
+    """
+
+    keys = [normalise_key(label) for label in _record_journal_labels(item)]
+    for key in keys:
+        journal = lookup.get(key)
+        if journal is not None:
+            return journal
+
+    best: JournalConfig | None = None
+    best_length = 0
+    for key in keys:
+        padded = f"-{key}-"
+        for candidate, journal in lookup.items():
+            if len(candidate) > best_length and f"-{candidate}-" in padded:
+                best, best_length = journal, len(candidate)
+    return best
+
+
+def _parse_paper(item: dict, journal: JournalConfig) -> Paper:
+    title = _strip_html(item.get("title")) or "Untitled"
+    abstract = _strip_html(item.get("abstractText"))
+    authors = _parse_authors(item.get("authorString"))
+    publication_date = _parse_date(item.get("firstPublicationDate"))
+
+    url: str = ""
+    doi = item.get("doi")
+    if doi:
+        url = f"https://doi.org/{doi}"
+    elif item.get("pmcid"):
+        url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/{item['pmcid']}"
+    elif item.get("id"):
+        # Fallback to Europe PMC article page
+        source = item.get("source", "MED")
+        url = f"https://www.ebi.ac.uk/europepmc/article/{source}/{item['id']}"
+
+    score = float(item.get("score", 0.0)) if item.get("score") else None
+
+    return Paper(
+        journal=journal.name,
+        title=title,
+        url=url,
+        published=publication_date,
+        authors=authors,
+        summary=abstract,
+        source_score=score,
+    )
+
+
+def create_client(timeout: float) -> httpx.AsyncClient:
+    """
+    Build the HTTP/2 client shared by every Europe PMC request of a run so that
+    journal queries are multiplexed over a few pooled connections.
+    """
+
+    limits = httpx.Limits(
+        max_keepalive_connections=MAX_CONNECTIONS,
+        max_connections=MAX_CONNECTIONS,
+    )
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=limits,
+        retries=CONNECT_RETRIES,
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=timeout,
+        headers={"User-Agent": USER_AGENT},
+    )
+
+
+def default_cache_dir() -> Path:
+    """
+    Location of the response cache; honours GIVELIT_CACHE_DIR and XDG_CACHE_HOME.
+    """
+
+    override = os.getenv("GIVELIT_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.getenv("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "givelit"
+
+
+class ResponseCache:
+    """
+    On-disk store of Europe PMC search results keyed by the request parameters.
+    Expired entries are deleted when read and swept once per instance on the
+    first write.
+    """
+
+    def __init__(self, directory: Path, ttl: float = CACHE_TTL_SECONDS) -> None:
+        self._directory = directory
+        self._ttl = ttl
+        self._pruned = False
+
+    def _path(self, params: dict[str, str]) -> Path:
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+        return self._directory / f"{digest}.json"
+
+    def get(self, params: dict[str, str]) -> dict | None:
+        path = self._path(params)
+        try:
+            if time.time() - path.stat().st_mtime > self._ttl:
+                path.unlink(missing_ok=True)
+                return None
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def prune(self) -> None:
+        """
+        Delete every cached response, and any temporary file left behind by an
+        interrupted write, older than the TTL.
+        """
+
+        cutoff = time.time() - self._ttl
+        try:
+            entries = [*self._directory.glob("*.json"), *self._directory.glob("*.tmp")]
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    entry.unlink(missing_ok=True)
+            except OSError:
+                continue
+
+    def put(self, params: dict[str, str], payload: dict) -> None:
+        if not self._pruned:
+            self._pruned = True
+            self.prune()
+        path = self._path(params)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_suffix(f".{os.getpid()}.tmp")
+            partial.write_text(json.dumps(payload), encoding="utf-8")
+            partial.replace(path)
+        except OSError:
+            # caching is best effort; an unwritable cache never fails a search
+            pass
+
+
 @dataclass
 class EuropePMCFetchResult:
     journal: JournalConfig
@@ -92,9 +327,15 @@ class EuropePMCFetcher:
     Retrieve journal articles from Europe PMC concurrently.
     """
 
-    def __init__(self, timeout: float = 15.0, mailto: str | None = None) -> None:
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        mailto: str | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
         self._timeout = timeout
         self._mailto = mailto or "givelit@example.com"
+        self._cache = cache
 
     @property
     def timeout(self) -> float:
@@ -107,27 +348,23 @@ class EuropePMCFetcher:
         days_back: int,
         max_results: int,
     ) -> List[EuropePMCFetchResult]:
-        async with httpx.AsyncClient(
-            timeout=self._timeout,
-            headers={"User-Agent": USER_AGENT},
-        ) as client:
+        async with create_client(self._timeout) as client:
             tasks = [
-                self.fetch_for_journal(client, journal, keywords, days_back, max_results)
-                for journal in journals
+                self.fetch_for_journal_batch(client, batch, keywords, days_back, max_results)
+                for batch in batch_journals(journals)
             ]
-            results = await asyncio.gather(*tasks)
-        return results
+            batches = await asyncio.gather(*tasks)
+        return [result for batch in batches for result in batch]
 
-    async def fetch_for_journal(
+    async def _search(
         self,
         client: httpx.AsyncClient,
-        journal: JournalConfig,
-        keywords: List[str],
-        days_back: int,
-        max_results: int,
-    ) -> EuropePMCFetchResult:
-        query = _build_query(journal, keywords, days_back)
-        page_size = max(25, min(max_results * 3, 200))
+        query: str,
+        page_size: int,
+    ) -> tuple[List[dict], int]:
+        """
+        Return one page of records and the total hit count reported for the query.
+        """
 
         params = {
             "query": query,
@@ -136,41 +373,94 @@ class EuropePMCFetcher:
             "resultType": "core",
         }
 
+        if self._cache is not None:
+            cached = self._cache.get(params)
+            # entries written before hit counts were cached hold a bare list
+            if isinstance(cached, dict):
+                return cached["result"], cached["hitCount"]
+
         response = await client.get(BASE_URL, params=params)
         response.raise_for_status()
         payload = response.json()
 
         results = payload.get("resultList", {}).get("result", [])
+        hit_count = int(payload.get("hitCount", len(results)))
+        if self._cache is not None:
+            self._cache.put(params, {"hitCount": hit_count, "result": results})
+        return results, hit_count
+
+    async def fetch_for_journal(
+        self,
+        client: httpx.AsyncClient,
+        journal: JournalConfig,
+        keywords: List[str],
+        days_back: int,
+        max_results: int,
+    ) -> EuropePMCFetchResult:
+        query = _build_query(journal, keywords, days_back)
+        results, _ = await self._search(client, query, _page_size(max_results))
 
-        papers: List[Paper] = []
+        papers = [_parse_paper(item, journal) for item in results]
+        return EuropePMCFetchResult(journal=journal, papers=papers)
+
+    async def fetch_for_journal_batch(
+        self,
+        client: httpx.AsyncClient,
+        journals: Sequence[JournalConfig],
+        keywords: List[str],
+        days_back: int,
+        max_results: int,
+    ) -> List[EuropePMCFetchResult]:
+        """
+        Query several journals with one request and split the records back into
+        one result per journal. When Europe PMC reports more hits than the page
+        holds, journals left underfilled are queried individually so that
+        high-volume titles cannot crowd the others out.
+        """
+
+        if len(journals) == 1:
+            return [
+                await self.fetch_for_journal(client, journals[0], keywords, days_back, max_results)
+            ]
+
+        query = _build_query(journals, keywords, days_back)
+        per_journal = _page_size(max_results)
+        page_size = min(MAX_PAGE_SIZE, per_journal * len(journals))
+        results, hit_count = await self._search(client, query, page_size)
+
+        lookup: dict[str, JournalConfig] = {}
+        for journal in journals:
+            lookup.setdefault(normalise_key(journal.container_title), journal)
+            lookup.setdefault(normalise_key(journal.name), journal)
+
+        grouped: dict[str, List[Paper]] = {journal.container_title: [] for journal in journals}
         for item in results:
-            title = _strip_html(item.get("title")) or "Untitled"
-            abstract = _strip_html(item.get("abstractText"))
-            authors = _parse_authors(item.get("authorString"))
-            publication_date = _parse_date(item.get("firstPublicationDate"))
-
-            url: str = ""
-            doi = item.get("doi")
-            if doi:
-                url = f"https://doi.org/{doi}"
-            elif item.get("pmcid"):
-                url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/{item['pmcid']}"
-            elif item.get("id"):
-                # Fallback to Europe PMC article page
-                source = item.get("source", "MED")
-                url = f"https://www.ebi.ac.uk/europepmc/article/{source}/{item['id']}"
-
-            score = float(item.get("score", 0.0)) if item.get("score") else None
-
-            paper = Paper(
-                journal=journal.name,
-                title=title,
-                url=url,
-                published=publication_date,
-                authors=authors,
-                summary=abstract,
-                source_score=score,
+            journal = _match_journal(item, lookup)
+            if journal is not None:
+                bucket = grouped[journal.container_title]
+                if len(bucket) < per_journal:
+                    bucket.append(_parse_paper(item, journal))
+
+        batch_results = {
+            journal.container_title: EuropePMCFetchResult(
+                journal=journal,
+                papers=grouped[journal.container_title],
+            )
+            for journal in journals
+        }
+
+        # only a truncated page can have crowded records of a journal out
+        if hit_count > len(results):
+            underfilled = [
+                journal for journal in journals if len(grouped[journal.container_title]) < per_journal
+            ]
+            retried = await asyncio.gather(
+                *(
+                    self.fetch_for_journal(client, journal, keywords, days_back, max_results)
+                    for journal in underfilled
+                )
             )
-            papers.append(paper)
+            for result in retried:
+                batch_results[result.journal.container_title] = result
 
-        return EuropePMCFetchResult(journal=journal, papers=papers[: max_results * 2])
+        return [batch_results[journal.container_title] for journal in journals]
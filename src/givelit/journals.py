@@ -5,11 +5,16 @@ Definitions and helpers for supported journals.
 from __future__ import annotations
 
 import re
-from typing import Iterable, List, Sequence
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Sequence
 
 from .models import JournalConfig
 
 
+_SPLIT_RE = re.compile(r"[;,]")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
 DEFAULT_JOURNALS: Sequence[JournalConfig] = (
     JournalConfig(key="cell", name="Cell", container_title="Cell"),
     JournalConfig(key="cell-genomics", name="Cell Genomics", container_title="Cell Genomics"),
@@ -55,19 +60,40 @@ PREPRINT_JOURNALS: Sequence[JournalConfig] = (
 )
 
 
+def _build_canonical_lookup() -> Mapping[str, JournalConfig]:
+    lookup: dict[str, JournalConfig] = {}
+    for journal in (*DEFAULT_JOURNALS, *PREPRINT_JOURNALS):
+        lookup[journal.key_lc] = journal
+        lookup[journal.name_lc] = journal
+        lookup[journal.container_title_lc] = journal
+    return MappingProxyType(lookup)
+
+
+_CANONICAL_LOOKUP = _build_canonical_lookup()
+
+
+def canonical_lookup() -> Mapping[str, JournalConfig]:
+    """
+    Read-only mapping from lowercased keys, names, and container titles of the
+    built-in journals to their configurations.
+    """
+
+    return _CANONICAL_LOOKUP
+
+
 def normalise_key(label: str) -> str:
     """
     Convert arbitrary journal names to kebab-case keys.
     """
 
-    key = re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-")
+    key = _SLUG_RE.sub("-", label.lower()).strip("-")
     return key or "journal"
 
 
 def _tokenise(values: Iterable[str]) -> List[str]:
     tokens: List[str] = []
     for value in values:
-        for part in re.split(r"[;,]", value):
+        for part in _SPLIT_RE.split(value):
             cleaned = part.strip()
             if cleaned:
                 tokens.append(cleaned)
@@ -91,12 +117,7 @@ def resolve_journals(
     if not user_values:
         return base_journals
 
-    canonical_lookup = {}
-    for journal in list(DEFAULT_JOURNALS) + list(PREPRINT_JOURNALS):
-        canonical_lookup[journal.key.lower()] = journal
-        canonical_lookup[journal.name.lower()] = journal
-        canonical_lookup[journal.container_title.lower()] = journal
-
+    lookup = canonical_lookup()
     tokens = _tokenise(user_values)
     resolved: dict[str, JournalConfig] = {}
 
@@ -111,8 +132,8 @@ def resolve_journals(
         lowered = token.lower()
         if lowered == "all":
             continue
-        if lowered in canonical_lookup:
-            journal = canonical_lookup[lowered]
+        if lowered in lookup:
+            journal = lookup[lowered]
         else:
             journal = JournalConfig(
                 key=normalise_key(token),
@@ -6,10 +6,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JournalConfig:
     """
     Represents a search target that can be translated into a Europe PMC query.
@@ -20,9 +21,18 @@ class JournalConfig:
     container_title: str
     constraint_field: str = "JOURNAL"
     date_field: str = "FIRST_PDATE"
+    key_lc: str = field(init=False, repr=False, compare=False)
+    name_lc: str = field(init=False, repr=False, compare=False)
+    container_title_lc: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # lowercased labels used for case-insensitive lookups
+        object.__setattr__(self, "key_lc", self.key.lower())
+        object.__setattr__(self, "name_lc", self.name.lower())
+        object.__setattr__(self, "container_title_lc", self.container_title.lower())
 
-@dataclass
+
+@dataclass(slots=True)
 class Paper:
     """
     Normalised representation of an article returned by Europe PMC.
@@ -38,8 +48,20 @@ class Paper:
     source_score: Optional[float] = None
     age_days: Optional[int] = None
     match_count: int = 0
+    # derived from ``published`` in __post_init__, never passed in
+    published_ts: Optional[int] = field(init=False, repr=False, compare=False, default=None)
+
+    def __post_init__(self) -> None:
+        if self.published is not None:
+            self.published_ts = int(self.published.timestamp())
 
     def formatted_date(self) -> str:
         if not self.published:
             return "Unknown"
-        return self.published.strftime("%A, %Y-%m-%d")
+        return _format_date(self.published)
+
+
+@lru_cache(maxsize=1024)
+def _format_date(published: datetime) -> str:
+    # papers in a report share a handful of publication days
+    return published.strftime("%A, %Y-%m-%d")
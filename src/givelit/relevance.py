@@ -4,32 +4,43 @@ Relevance scoring for retrieved papers.
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
-from typing import Iterable, Optional
+from itertools import repeat
+from typing import Iterable, List, Optional, Sequence
 
 from .models import Paper
 
 
+SECONDS_PER_DAY = 86_400
+
+
+def normalise_keywords(keywords: Iterable[str]) -> list[str]:
+    """
+    Lowercase and strip keywords once per run, dropping empty entries.
+    """
+
+    return [target for target in (keyword.lower().strip() for keyword in keywords) if target]
+
+
 def compute_relevance(
     paper: Paper,
-    keywords: Iterable[str],
+    keywords_lc: Sequence[str],
     recency_window: int,
     reference: Optional[datetime] = None,
 ) -> float:
     """
     Combine keyword matches, recency, and Europe PMC's inherent score.
+    Keywords must already be normalised with ``normalise_keywords``.
     """
 
-    now = reference or datetime.now(tz=UTC)
-    text = f"{paper.title} {paper.summary or ''}".lower()
+    now_ts = int((reference or datetime.now(tz=UTC)).timestamp())
     title = paper.title.lower()
+    text = f"{title} {(paper.summary or '').lower()}"
     score = 0.0
 
     matched_keywords = 0
-    for keyword in keywords:
-        target = keyword.lower().strip()
-        if not target:
-            continue
+    for target in keywords_lc:
         title_hits = title.count(target)
         if title_hits:
             score += 6.0 * title_hits
@@ -46,10 +57,10 @@ def compute_relevance(
         score += 4.0 * matched_keywords
 
     age_days: Optional[int] = None
-    if paper.published:
-        delta = now - paper.published
-        if delta.days >= 0:
-            age_days = delta.days
+    if paper.published_ts is not None:
+        elapsed_days = (now_ts - paper.published_ts) // SECONDS_PER_DAY
+        if elapsed_days >= 0:
+            age_days = elapsed_days
     paper.age_days = age_days
 
     if age_days is not None:
@@ -61,3 +72,48 @@ def compute_relevance(
     paper.match_count = matched_keywords
     paper.relevance = round(score, 2)
     return paper.relevance
+
+
+def _score_batch(
+    papers: List[Paper],
+    keywords_lc: Sequence[str],
+    recency_window: int,
+    reference: datetime,
+) -> List[Paper]:
+    for paper in papers:
+        compute_relevance(paper, keywords_lc, recency_window, reference=reference)
+    return papers
+
+
+def score_papers(
+    papers: Sequence[Paper],
+    keywords_lc: Sequence[str],
+    recency_window: int,
+    reference: Optional[datetime] = None,
+    jobs: int = 1,
+) -> List[Paper]:
+    """
+    Score every paper and return them in their original order.
+
+    Papers are scored in-process unless ``jobs`` asks for more than one worker
+    process. Papers scored in worker processes come back as new objects, so
+    callers must use the returned list rather than the input.
+    """
+
+    reference = reference or datetime.now(tz=UTC)
+    papers = list(papers)
+    jobs = min(jobs, len(papers))
+    if jobs <= 1:
+        return _score_batch(papers, keywords_lc, recency_window, reference)
+
+    shard_size = -(-len(papers) // jobs)
+    shards = [papers[start:start + shard_size] for start in range(0, len(papers), shard_size)]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        scored = pool.map(
+            _score_batch,
+            shards,
+            repeat(keywords_lc),
+            repeat(recency_window),
+            repeat(reference),
+        )
+        return [paper for shard in scored for paper in shard]
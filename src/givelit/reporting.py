@@ -4,343 +4,44 @@ Rendering utilities for CLI and HTML reports.
 
 from __future__ import annotations
 
-from datetime import datetime
+import os
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
 from html import escape
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable, Sequence, Dict
+from typing import Iterable, Iterator, Sequence, Dict
 
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.table import Table
 from rich.text import Text
 
 from .models import Paper
 
 
-def _summarise_by_journal(papers: Sequence[Paper]) -> list[tuple[str, int, float]]:
-    summary: dict[str, list[float]] = {}
-    for paper in papers:
-        bucket = summary.setdefault(paper.journal, [])
-        bucket.append(paper.relevance)
-    rows: list[tuple[str, int, float]] = []
-    for journal, scores in summary.items():
-        count = len(scores)
-        avg = sum(scores) / count if count else 0.0
-        rows.append((journal, count, avg))
-    rows.sort(key=lambda item: (-item[1], -item[2], item[0].lower()))
-    return rows
-
-
-def _ascii_plot(rows: Sequence[tuple[str, int, float]], width: int = 18) -> list[str]:
-    if not rows:
-        return []
-    max_count = max(count for _, count, _ in rows) or 1
-    lines: list[str] = []
-    for journal, count, avg in rows:
-        length = int(round((count / max_count) * width)) if count else 0
-        bar = "█" * max(length, 1 if count else 0)
-        lines.append(
-            f"{journal:<22} | {bar:<{width}} {count} paper{'s' if count != 1 else ''}, avg {avg:.2f}"
-        )
-    return lines
-
-
-def _coverage_level(paper: Paper, total_keywords: int) -> str:
-    if total_keywords <= 0:
-        return "unmatched"
-    matched = max(0, paper.match_count)
-    if matched >= total_keywords:
-        return "full"
-    if total_keywords > 2 and matched >= total_keywords - 1:
-        return "near"
-    if matched >= 2:
-        return "partial"
-    if matched >= 1:
-        return "single"
-    return "unmatched"
-
-
-def _group_by_coverage(papers: Sequence[Paper], total_keywords: int) -> Dict[str, list[Paper]]:
-    groups: Dict[str, list[Paper]] = {"full": [], "near": [], "partial": [], "single": []}
-    for paper in papers:
-        level = _coverage_level(paper, total_keywords)
-        if level not in groups:
-            groups[level] = []
-        groups[level].append(paper)
-    return {level: groups[level] for level in ["full", "near", "partial", "single"] if groups[level]}
-
-
-def _match_descriptor(items: Sequence[Paper], total_keywords: int) -> str:
-    if total_keywords <= 0:
-        return "no keywords configured"
-    counts = sorted({max(0, min(total_keywords, paper.match_count)) for paper in items})
-    plural = "" if total_keywords == 1 else "s"
-    if not counts:
-        return f"0 of {total_keywords} keyword{plural} matched"
-    if len(counts) == 1:
-        count = counts[0]
-        if count >= total_keywords:
-            return f"all {total_keywords} keyword{plural} matched"
-        if count == 0:
-            return f"0 of {total_keywords} keyword{plural} matched"
-        return f"{count} of {total_keywords} keyword{plural} matched"
-    return f"{counts[0]}–{counts[-1]} of {total_keywords} keyword{plural} matched"
-
-
-def render_cli_report(
-    console: Console,
-    papers: Sequence[Paper],
-    keywords: Iterable[str],
-    journals: Iterable[str],
-    options: dict[str, str] | None = None,
-    missing_journals: Sequence[str] | None = None,
-) -> None:
-    """
-    Print a compact table with hyperlinks to the console.
-    """
-
-    header = Text("giveLit — give me literature", style="bold green")
-    console.print(header)
-
-    options = options or {}
-    keywords_list = list(keywords)
-    journals_list = list(journals)
-    bullet = "✦"
-
-    console.print(Text(f"{bullet} Keywords: {', '.join(f'\"{kw}\"' for kw in keywords_list)}", style="cyan"))
-    console.print(Text(f"{bullet} Days window: {options.get('days', 'n/a')}", style="cyan"))
-    console.print(Text(f"{bullet} Limit: {options.get('limit', 'n/a')}", style="cyan"))
-    console.print(Text(f"{bullet} Sort: {options.get('sort', 'score')}", style="cyan"))
-    coverage_mode = options.get('coverage', 'all')
-    console.print(Text(f"{bullet} Coverage: {coverage_mode.title()}", style="cyan"))
-
-    hits = {paper.journal for paper in papers}
-    journal_buffer = [f"[{name}]" if name in hits else name for name in journals_list]
-    journal_count = options.get('journal_count', str(len(journals_list)))
-    console.print(Text(f"{bullet} Journals searched ({journal_count})", style="magenta"))
-    if journal_buffer:
-        per_line = 4
-        chunks = [" | ".join(journal_buffer[i:i + per_line]) for i in range(0, len(journal_buffer), per_line)]
-        for chunk in chunks:
-            console.print(Text(f"    {chunk}", style="magenta"))
-    console.print()
-
-    total_keywords = len(keywords_list)
-    groups = _group_by_coverage(papers, total_keywords)
-
-    coverage_base_titles = {
-        "full": "Full coverage",
-        "near": "Near full coverage",
-        "partial": "Partial coverage",
-        "single": "Single keyword coverage",
-    }
-
-    if not papers:
-        console.print(Text("No papers matched the filters.", style="yellow"))
-        return
-
-    if groups:
-        console.print(Text("Coverage summary", style="bold cyan"))
-        for level in ["full", "near", "partial", "single"]:
-            items = groups.get(level)
-            if not items:
-                continue
-            ascii_rows = _ascii_plot(_summarise_by_journal(items))
-            if not ascii_rows:
-                continue
-            descriptor = _match_descriptor(items, total_keywords)
-            coverage_title = f"{coverage_base_titles.get(level, level.title())} ({descriptor})"
-            console.print(Text(coverage_title, style="bold magenta"))
-            for line in ascii_rows:
-                console.print(Text(line, style="green"))
-            console.print()
-
-    for level, items in groups.items():
-        descriptor = _match_descriptor(items, total_keywords)
-        title = f"{coverage_base_titles.get(level, level.title())} ({descriptor})"
-        table = Table(
-            show_lines=False,
-            box=box.SIMPLE_HEAD,
-            header_style="bold cyan",
-            padding=(0, 1),
-            title=title,
-        )
-        table.add_column("Journal", style="magenta", no_wrap=True)
-        table.add_column("Title", style="white", overflow="fold")
-        table.add_column("Date", style="green", no_wrap=True)
-        table.add_column("giveLit score", justify="right", style="bold cyan")
-        table.add_column("Days ago", justify="right", style="cyan")
-        table.add_column("Authors", style="dim", overflow="fold")
-
-        for paper in items:
-            row_title = Text(paper.title.strip() or "Untitled")
-            if paper.url:
-                row_title.stylize(f"link {paper.url}")
-            authors = ", ".join(paper.authors[:4])
-            if len(paper.authors) > 4:
-                authors += ", et al."
-
-            score_str = f"{paper.relevance:.2f}"
-            age_str = "—"
-            if paper.age_days is not None:
-                age_str = str(paper.age_days)
-
-            table.add_row(
-                paper.journal,
-                row_title,
-                paper.formatted_date(),
-                score_str,
-                age_str,
-                authors or "—",
-            )
-
-        console.print(table)
-        console.print()
-
-
-
-def write_html_report(
-    papers: Sequence[Paper],
-    keywords: Iterable[str],
-    journals: Iterable[str],
-    output_path: Path,
-    options: dict[str, str] | None = None,
-    missing_journals: Sequence[str] | None = None,
-) -> Path:
-    """
-    Generate a minimalist HTML report with clickable cards.
-    """
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    generated = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
-    options = options or {}
-    keywords_list = list(keywords)
-    journals_list = list(journals)
-    keywords_display = ", ".join(f'"{kw}"' for kw in keywords_list)
-
-    hits = {paper.journal for paper in papers}
-    meta_entries = [
-        f"✦ Keywords: {keywords_display}",
-        f"✦ Days window: {options.get('days', 'n/a')}",
-        f"✦ Limit: {options.get('limit', 'n/a')}",
-        f"✦ Sort: {options.get('sort', 'score')}",
-        f"✦ Coverage: {options.get('coverage', 'all').title()}",
-    ]
-    meta_html = [f"<li>{escape(item)}</li>" for item in meta_entries]
-    meta_html.append(f"<li>✦ Generated: {escape(generated)}</li>")
-    journal_fragments: list[str] = []
-    for index, name in enumerate(journals_list):
-        if index:
-            journal_fragments.append("<span class=\"journal-sep\">|</span>")
-        classes = ["journal-pill"]
-        if name in hits:
-            classes.append("hit")
-        journal_fragments.append(
-            f"<span class=\"{' '.join(classes)}\">{escape(name)}</span>"
-        )
-    journal_body = "".join(journal_fragments)
-    journal_label = escape(f"✦ Journals searched ({options.get('journal_count', str(len(journals_list)))})")
-    meta_html.append(
-        "<li class=\"journal-block\">"
-        f"<span class=\"journal-block-label\">{journal_label}</span>"
-        f"<div class=\"journal-pill-wrap\">{journal_body}</div>"
-        "</li>"
-    )
-    meta_list = "".join(meta_html)
-
-    coverage_groups = _group_by_coverage(papers, len(keywords_list))
-    summary_sections: list[str] = []
-    summary_base_titles = {
-        "full": "Journal summary — full coverage",
-        "near": "Journal summary — near coverage",
-        "partial": "Journal summary — partial coverage",
-        "single": "Journal summary — single keyword",
-    }
-    for level, items in coverage_groups.items():
-        rows = _ascii_plot(_summarise_by_journal(items))
-        if not rows:
-            continue
-        summary_body = escape("\n".join(rows))
-        descriptor = _match_descriptor(items, len(keywords_list))
-        title = f"{summary_base_titles.get(level, level.title())} ({descriptor})"
-        summary_sections.append(
-            "<section class=\"summary\">"
-            f"<h2>{escape(title)}</h2>"
-            f"<pre class=\"summary-plot\">{summary_body}</pre>"
-            "</section>"
-        )
-    summary_section = "".join(summary_sections)
-
-    cards: list[str] = []
-    if coverage_groups:
-        cards.append("<section class=\"coverage-groups\">")
-    coverage_base_titles = {
-        "full": "Full coverage",
-        "near": "Near full coverage",
-        "partial": "Partial coverage",
-        "single": "Single keyword coverage",
-    }
-    for level, items in coverage_groups.items():
-        descriptor = _match_descriptor(items, len(keywords_list))
-        cards.append(f"<h2 class=\"coverage-heading\">{coverage_base_titles.get(level, level.title())} ({escape(descriptor)})</h2>")
-        for paper in items:
-            authors = ", ".join(paper.authors[:6]) or "Unknown authors"
-            if len(paper.authors) > 6:
-                authors += ", et al."
-
-            summary = paper.summary or "No abstract available."
-            safe_summary = escape(summary)
-            title_text = escape(paper.title)
-            url = escape(paper.url, quote=True)
-            journal_label = escape(paper.journal)
-            authors_text = escape(authors)
-            date_text = escape(paper.formatted_date())
-            if paper.age_days is not None:
-                age_text = escape(f"Days ago: {paper.age_days}")
-            else:
-                age_text = escape("Days ago: unknown")
-
-            card = f"""
-        <article class="card">
-            <header>
-                <h2><a href="{url}" target="_blank" rel="noopener">{title_text}</a></h2>
-                <div class="meta">
-                    <span class="journal">Journal: {journal_label}</span>
-                    <span class="separator">|</span>
-                    <span class="date">{date_text}</span>
-                    <span class="separator">|</span>
-                    <span class="age">{age_text}</span>
-                    <span class="separator">|</span>
-                    <span class="score"><span class="badge">giveLit score</span><span class="value">{paper.relevance:.2f}</span></span>
-                </div>
-            </header>
-            <p class="authors">{authors_text}</p>
-            <p class="summary">{safe_summary}</p>
-        </article>
-        """
-            cards.append(card.strip())
-    if coverage_groups:
-        cards.append("</section>")
-
-    html = f"""<!DOCTYPE html>
+_HEAD_PREFIX = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="utf-8" />
     <title>giveLit Report</title>
     <style>
-        :root {{
+"""
+
+_CSS = """        :root {
             --bg: #040404;
             --text: #7fffb3;
             --accent: #00ff90;
             --muted: #3ddc84;
             --journal: #b8ffd6;
             --border: rgba(0, 255, 144, 0.35);
-        }}
-        * {{
+        }
+        * {
             box-sizing: border-box;
-        }}
-        body {{
+        }
+        body {
             margin: 0 auto;
             padding: 2.5rem 1.5rem;
             max-width: 880px;
@@ -348,48 +49,48 @@ def write_html_report(
             color: var(--text);
             font-family: "IBM Plex Mono", "SFMono-Regular", Menlo, Consolas, "Liberation Mono", monospace;
             letter-spacing: 0.03em;
-        }}
-        .meta-list {{
+        }
+        .meta-list {
             list-style: none;
             padding: 0;
             margin: 0 0 1rem 0;
             column-count: 2;
             column-gap: 1.4rem;
-        }}
-        @media (max-width: 720px) {{
-            .meta-list {{
+        }
+        @media (max-width: 720px) {
+            .meta-list {
                 column-count: 1;
-            }}
-        }}
-        .meta-list li {{
+            }
+        }
+        .meta-list li {
             margin: 0.25rem 0;
             color: var(--muted);
             break-inside: avoid;
-        }}
-        .journal-block {{
+        }
+        .journal-block {
             column-span: all;
             margin-top: 0.75rem;
-        }}
-        .journal-block-label {{
+        }
+        .journal-block-label {
             display: block;
             margin-bottom: 0.4rem;
             color: var(--muted);
-        }}
-        .journal-pill-wrap {{
+        }
+        .journal-pill-wrap {
             display: flex;
             flex-wrap: wrap;
             gap: 0.25rem;
             align-items: center;
-        }}
-        .journal-sep {{
+        }
+        .journal-sep {
             display: inline-flex;
             align-items: center;
             padding: 0 0.2rem;
             color: var(--muted);
             opacity: 0.55;
             font-size: 0.95rem;
-        }}
-        .journal-pill {{
+        }
+        .journal-pill {
             display: inline-flex;
             align-items: center;
             justify-content: center;
@@ -399,27 +100,27 @@ def write_html_report(
             color: var(--muted);
             background: transparent;
             letter-spacing: 0.05em;
-        }}
-        .journal-pill.hit {{
+        }
+        .journal-pill.hit {
             padding: 0.2rem 0.65rem;
             border-radius: 0.45rem;
             border: 1px solid var(--accent);
             color: var(--accent);
             background: rgba(0, 255, 144, 0.12);
             box-shadow: 0 0 0 1px rgba(0, 255, 144, 0.08);
-        }}
-        .meta-list li.journal-item {{
+        }
+        .meta-list li.journal-item {
             color: var(--text);
-        }}
-        .summary {{
+        }
+        .summary {
             margin-bottom: 1.8rem;
-        }}
-        .summary h2 {{
+        }
+        .summary h2 {
             margin: 0 0 0.6rem 0;
             font-size: 1.1rem;
             color: var(--accent);
-        }}
-        .summary-plot {{
+        }
+        .summary-plot {
             margin: 0;
             padding: 1rem;
             border: 1px solid var(--border);
@@ -429,67 +130,67 @@ def write_html_report(
             white-space: pre;
             font-size: 0.9rem;
             line-height: 1.5;
-        }}
-        header.page-header {{
+        }
+        header.page-header {
             margin-bottom: 2rem;
-        }}
-        header.page-header h1 {{
+        }
+        header.page-header h1 {
             margin: 0 0 0.75rem 0;
             font-size: 2rem;
             color: var(--accent);
-        }}
-        .coverage-groups {{
+        }
+        .coverage-groups {
             margin-top: 1.5rem;
-        }}
-        .coverage-heading {{
+        }
+        .coverage-heading {
             margin: 1.6rem 0 0.6rem 0;
             font-size: 1.3rem;
             color: var(--accent);
-        }}
-        .card {{
+        }
+        .card {
             padding: 1.2rem;
             border: 1px solid var(--border);
             border-radius: 0.75rem;
             margin-bottom: 1.1rem;
             background: transparent;
-        }}
-        .card:last-child {{
+        }
+        .card:last-child {
             margin-bottom: 0;
-        }}
-        .card h2 {{
+        }
+        .card h2 {
             margin: 0 0 0.6rem 0;
             font-size: 1.25rem;
             color: var(--accent);
-        }}
-        .card a {{
+        }
+        .card a {
             color: var(--accent);
             text-decoration: none;
-        }}
-        .card a:hover {{
+        }
+        .card a:hover {
             text-decoration: underline;
-        }}
-        .meta {{
+        }
+        .meta {
             display: flex;
             flex-wrap: wrap;
             gap: 0.75rem;
             font-size: 0.85rem;
             color: var(--muted);
-        }}
-        .meta span {{
+        }
+        .meta span {
             display: inline-flex;
             align-items: center;
             gap: 0.25rem;
-        }}
-        .journal {{
+        }
+        .journal {
             color: var(--journal);
             text-transform: uppercase;
             letter-spacing: 0.08em;
-        }}
-        .separator {{
+        }
+        .separator {
             color: var(--muted);
             opacity: 0.6;
-        }}
-        .score {{
+        }
+        .score {
             display: inline-flex;
             align-items: center;
             gap: 0.45rem;
@@ -497,51 +198,64 @@ def write_html_report(
             border: 1px solid var(--accent);
             border-radius: 0.4rem;
             background: rgba(0, 255, 144, 0.08);
-        }}
-        .score .badge {{
+        }
+        .score .badge {
             font-size: 0.7rem;
             text-transform: uppercase;
             letter-spacing: 0.12em;
-        }}
-        .score .value {{
+        }
+        .score .value {
             font-weight: 600;
             color: var(--accent);
-        }}
-        .age {{
+        }
+        .age {
             color: var(--journal);
-        }}
-        .authors {{
+        }
+        .authors {
             font-size: 0.9rem;
             margin: 0.9rem 0 0.6rem 0;
             color: var(--text);
-        }}
-        .summary {{
+        }
+        .summary {
             font-size: 0.95rem;
             line-height: 1.6;
             color: var(--muted);
-        }}
-        .missing {{
+        }
+        .missing {
             margin-top: 0.75rem;
             font-size: 0.9rem;
             color: var(--muted);
-        }}
-        footer {{
+        }
+        footer {
             margin-top: 2rem;
             font-size: 0.85rem;
             color: var(--muted);
-        }}
-    </style>
+        }
+"""
+
+_HEAD_SUFFIX = """    </style>
 </head>
-<body>
+"""
+
+_NO_ABSTRACT = "No abstract available."
+_AGE_UNKNOWN = "Days ago: unknown"
+
+_BODY_OPEN = """<body>
     <header class="page-header">
         <h1>giveLit</h1>
         <ul class="meta-list">
-            {meta_list}
+            """
+
+_HEADER_CLOSE = """
         </ul>
     </header>
     <main>
-        {summary_section if summary_section else ''}
-        {' '.join(cards) if cards else '<p>No papers matched the filters.</p>'}
+        """
+
+_SUMMARY_CLOSE = """
+        """
+
+_BODY_CLOSE = """
     </main>
     <footer>
         Crafted with giveLit — give me literature.
@@ -550,5 +264,472 @@ def write_html_report(
 </html>
 """
 
-    output_path.write_text(html, encoding="utf-8")
+_CARD_TEMPLATE = """<article class="card">
+            <header>
+                <h2><a href="{url}" target="_blank" rel="noopener">{title}</a></h2>
+                <div class="meta">
+                    <span class="journal">Journal: {journal}</span>
+                    <span class="separator">|</span>
+                    <span class="date">{date}</span>
+                    <span class="separator">|</span>
+                    <span class="age">{age}</span>
+                    <span class="separator">|</span>
+                    <span class="score"><span class="badge">giveLit score</span><span class="value">{relevance:.2f}</span></span>
+                </div>
+            </header>
+            <p class="authors">{authors}</p>
+            <p class="summary">{summary}</p>
+        </article>"""
+
+_NO_RESULTS = "<p>No papers matched the filters.</p>"
+_JOURNAL_SEP = "<span class=\"journal-sep\">|</span>"
+_WRITE_BUFFER = 64 * 1024
+
+
+def _journal_totals(papers: Iterable[Paper]) -> Dict[str, list]:
+    totals: Dict[str, list] = {}
+    for paper in papers:
+        entry = totals.get(paper.journal)
+        if entry is None:
+            totals[paper.journal] = [paper.relevance, 1]
+        else:
+            entry[0] += paper.relevance
+            entry[1] += 1
+    return totals
+
+
+def _summarise_by_journal(totals: Dict[str, list]) -> list[tuple[str, int, float]]:
+    """
+    Turn per-journal ``[score_sum, count]`` accumulators into rows of
+    ``(journal, count, average)`` ordered by count, average, then name.
+    """
+
+    keyed = []
+    for journal, (total, count) in totals.items():
+        avg = total / count
+        keyed.append(((-count, -avg, journal.lower()), (journal, count, avg)))
+    keyed.sort(key=itemgetter(0))
+    return [row for _, row in keyed]
+
+
+def _ascii_plot(rows: Sequence[tuple[str, int, float]], width: int = 18) -> list[str]:
+    if not rows:
+        return []
+    max_count = max(count for _, count, _ in rows) or 1
+    lines: list[str] = []
+    for journal, count, avg in rows:
+        length = int(round((count / max_count) * width)) if count else 0
+        bar = ("█" * max(length, 1 if count else 0)).ljust(width)
+        lines.append(f"{journal.ljust(22)} | {bar} {count} paper{'s' if count != 1 else ''}, avg {avg:.2f}")
+    return lines
+
+
+def _coverage_thresholds(total_keywords: int) -> tuple[list[int], list[str]]:
+    """
+    Ascending match-count cutoffs and the coverage labels between them, so that
+    ``labels[bisect_right(cutoffs, matched)]`` is the coverage level of a paper.
+    """
+
+    cutoffs: list[int] = []
+    labels = ["unmatched"]
+    if total_keywords <= 0:
+        return cutoffs, labels
+    bounds = [(1, "single"), (2, "partial")]
+    if total_keywords > 2:
+        bounds.append((total_keywords - 1, "near"))
+    bounds.append((total_keywords, "full"))
+    for cutoff, label in bounds:
+        # later bounds take precedence over earlier ones they reach or undercut
+        while cutoffs and cutoffs[-1] >= cutoff:
+            cutoffs.pop()
+            labels.pop()
+        cutoffs.append(cutoff)
+        labels.append(label)
+    return cutoffs, labels
+
+
+_COVERAGE_LEVELS = ("full", "near", "partial", "single")
+_LEVEL_RANK = {level: rank for rank, level in enumerate(_COVERAGE_LEVELS)}
+
+
+def _group_by_coverage(
+    papers: Sequence[Paper],
+    total_keywords: int,
+) -> tuple[Dict[str, list[Paper]], Dict[str, list[tuple[str, int, float]]]]:
+    """
+    Bucket papers by coverage level and summarise every bucket per journal in
+    the same pass. Levels without papers are omitted from both mappings.
+    """
+
+    cutoffs, labels = _coverage_thresholds(total_keywords)
+    ranks = [_LEVEL_RANK.get(label) for label in labels]
+    ranked = [
+        (rank, paper)
+        for paper in papers
+        if (rank := ranks[bisect_right(cutoffs, paper.match_count)]) is not None
+    ]
+    # the sort is stable, so papers keep their order within each level
+    ranked.sort(key=itemgetter(0))
+
+    groups: Dict[str, list[Paper]] = {}
+    summaries: Dict[str, list[tuple[str, int, float]]] = {}
+    for rank, members in groupby(ranked, key=itemgetter(0)):
+        items: list[Paper] = []
+        totals: Dict[str, list] = {}
+        for _, paper in members:
+            items.append(paper)
+            entry = totals.get(paper.journal)
+            if entry is None:
+                totals[paper.journal] = [paper.relevance, 1]
+            else:
+                entry[0] += paper.relevance
+                entry[1] += 1
+        level = _COVERAGE_LEVELS[rank]
+        groups[level] = items
+        summaries[level] = _summarise_by_journal(totals)
+    return groups, summaries
+
+
+def _merge_coverage(
+    papers: Sequence[Paper],
+    total_keywords: int,
+) -> tuple[Dict[str, list[Paper]], Dict[str, list[tuple[str, int, float]]]]:
+    """
+    Collect every paper with at least one coverage level into a single
+    ``"all"`` group, for reports that do not split results by coverage.
+    """
+
+    cutoffs, labels = _coverage_thresholds(total_keywords)
+    items = [
+        paper for paper in papers
+        if labels[bisect_right(cutoffs, paper.match_count)] in _LEVEL_RANK
+    ]
+    if not items:
+        return {}, {}
+    return {"all": items}, {"all": _summarise_by_journal(_journal_totals(items))}
+
+
+def _match_descriptor(items: Sequence[Paper], total_keywords: int) -> str:
+    if total_keywords <= 0:
+        return "no keywords configured"
+    plural = "" if total_keywords == 1 else "s"
+    if not items:
+        return f"0 of {total_keywords} keyword{plural} matched"
+    # clamping to [0, total_keywords] is monotonic, so clamp the extremes only
+    low, high = total_keywords, 0
+    for paper in items:
+        matched = paper.match_count
+        if matched < low:
+            low = matched
+        if matched > high:
+            high = matched
+    low = max(0, low)
+    high = min(total_keywords, high)
+    if low == high:
+        if low >= total_keywords:
+            return f"all {total_keywords} keyword{plural} matched"
+        if low == 0:
+            return f"0 of {total_keywords} keyword{plural} matched"
+        return f"{low} of {total_keywords} keyword{plural} matched"
+    return f"{low}–{high} of {total_keywords} keyword{plural} matched"
+
+
+@dataclass(slots=True)
+class ReportModel:
+    """
+    Coverage groups and their per-level aggregates, computed once and shared by
+    the CLI and HTML renderers.
+    """
+
+    total_keywords: int
+    groups: Dict[str, list[Paper]]
+    summaries: Dict[str, list[tuple[str, int, float]]]
+    descriptors: Dict[str, str]
+    ascii_lines: Dict[str, list[str]]
+
+
+def build_report_model(
+    papers: Sequence[Paper],
+    keywords: Iterable[str],
+    split_by_coverage: bool = True,
+) -> ReportModel:
+    """
+    Group papers by coverage and precompute the journal summaries, match
+    descriptors, and ASCII plots for every level. With
+    ``split_by_coverage=False`` all papers share a single ``"all"`` group.
+    """
+
+    total_keywords = len(list(keywords))
+    if split_by_coverage:
+        groups, summaries = _group_by_coverage(papers, total_keywords)
+    else:
+        groups, summaries = _merge_coverage(papers, total_keywords)
+    return ReportModel(
+        total_keywords=total_keywords,
+        groups=groups,
+        summaries=summaries,
+        descriptors={level: _match_descriptor(items, total_keywords) for level, items in groups.items()},
+        ascii_lines={level: _ascii_plot(rows) for level, rows in summaries.items()},
+    )
+
+
+def _cli_row(paper: Paper) -> tuple[str, Text, str, str, str, str]:
+    row_title = Text(paper.title.strip() or "Untitled")
+    if paper.url:
+        row_title.stylize(f"link {paper.url}")
+    authors = ", ".join(paper.authors[:4])
+    if len(paper.authors) > 4:
+        authors += ", et al."
+
+    age_str = "—"
+    if paper.age_days is not None:
+        age_str = str(paper.age_days)
+
+    return (
+        paper.journal,
+        row_title,
+        paper.formatted_date(),
+        f"{paper.relevance:.2f}",
+        age_str,
+        authors or "—",
+    )
+
+
+def render_cli_report(
+    console: Console,
+    papers: Sequence[Paper],
+    keywords: Iterable[str],
+    journals: Iterable[str],
+    options: dict[str, str] | None = None,
+    missing_journals: Sequence[str] | None = None,
+    model: ReportModel | None = None,
+) -> None:
+    """
+    Print a compact table with hyperlinks to the console.
+    """
+
+    # collect everything and print once so rich renders a single batch
+    renderables: list[RenderableType] = []
+    header = Text("giveLit — give me literature", style="bold green")
+    renderables.append(header)
+
+    options = options or {}
+    keywords_list = list(keywords)
+    journals_list = list(journals)
+    bullet = "✦"
+
+    keywords_display = ", ".join(f'"{kw}"' for kw in keywords_list)
+    renderables.append(Text(f"{bullet} Keywords: {keywords_display}", style="cyan"))
+    renderables.append(Text(f"{bullet} Days window: {options.get('days', 'n/a')}", style="cyan"))
+    renderables.append(Text(f"{bullet} Limit: {options.get('limit', 'n/a')}", style="cyan"))
+    renderables.append(Text(f"{bullet} Sort: {options.get('sort', 'score')}", style="cyan"))
+    coverage_mode = options.get('coverage', 'all')
+    renderables.append(Text(f"{bullet} Coverage: {coverage_mode.title()}", style="cyan"))
+
+    hits = frozenset(paper.journal for paper in papers)
+    journal_buffer = ["[%s]" % name if name in hits else name for name in journals_list]
+    journal_count = options.get('journal_count', str(len(journals_list)))
+    renderables.append(Text(f"{bullet} Journals searched ({journal_count})", style="magenta"))
+    if journal_buffer:
+        per_line = 4
+        lines = "\n    ".join(
+            " | ".join(journal_buffer[i:i + per_line]) for i in range(0, len(journal_buffer), per_line)
+        )
+        renderables.append(Text(f"    {lines}", style="magenta"))
+    renderables.append(Text(""))
+
+    if model is None:
+        model = build_report_model(papers, keywords_list)
+    groups = model.groups
+
+    coverage_base_titles = {
+        "full": "Full coverage",
+        "near": "Near full coverage",
+        "partial": "Partial coverage",
+        "single": "Single keyword coverage",
+        "all": "All coverage levels",
+    }
+
+    if not papers:
+        renderables.append(Text("No papers matched the filters.", style="yellow"))
+        console.print(Group(*renderables))
+        return
+
+    if groups:
+        renderables.append(Text("Coverage summary", style="bold cyan"))
+        for level in groups:
+            ascii_rows = model.ascii_lines[level]
+            if not ascii_rows:
+                continue
+            coverage_title = f"{coverage_base_titles.get(level, level.title())} ({model.descriptors[level]})"
+            renderables.append(Text(coverage_title, style="bold magenta"))
+            for line in ascii_rows:
+                renderables.append(Text(line, style="green"))
+            renderables.append(Text(""))
+
+    for level, items in groups.items():
+        title = f"{coverage_base_titles.get(level, level.title())} ({model.descriptors[level]})"
+        table = Table(
+            show_lines=False,
+            box=box.SIMPLE_HEAD,
+            header_style="bold cyan",
+            padding=(0, 1),
+            title=title,
+        )
+        table.add_column("Journal", style="magenta", no_wrap=True)
+        table.add_column("Title", style="white", overflow="fold")
+        table.add_column("Date", style="green", no_wrap=True)
+        table.add_column("giveLit score", justify="right", style="bold cyan")
+        table.add_column("Days ago", justify="right", style="cyan")
+        table.add_column("Authors", style="dim", overflow="fold")
+
+        for paper in items:
+            table.add_row(*_cli_row(paper))
+
+        renderables.append(table)
+        renderables.append(Text(""))
+
+    console.print(Group(*renderables))
+
+
+def _iter_cards(model: ReportModel) -> Iterator[str]:
+    """
+    Yield the space-separated HTML fragments of the grouped paper cards.
+    """
+
+    yield "<section class=\"coverage-groups\">"
+    coverage_base_titles = {
+        "full": "Full coverage",
+        "near": "Near full coverage",
+        "partial": "Partial coverage",
+        "single": "Single keyword coverage",
+        "all": "All coverage levels",
+    }
+    journal_labels: dict[str, str] = {}
+    for level, items in model.groups.items():
+        descriptor = model.descriptors[level]
+        yield f" <h2 class=\"coverage-heading\">{coverage_base_titles.get(level, level.title())} ({escape(descriptor)})</h2>"
+        for paper in items:
+            authors = ", ".join(paper.authors[:6]) or "Unknown authors"
+            if len(paper.authors) > 6:
+                authors += ", et al."
+
+            safe_summary = escape(paper.summary) if paper.summary else _NO_ABSTRACT
+            title_text = escape(paper.title)
+            url = escape(paper.url, quote=True)
+            journal_text = journal_labels.get(paper.journal)
+            if journal_text is None:
+                journal_text = journal_labels[paper.journal] = escape(paper.journal)
+            authors_text = escape(authors)
+            # dates and ages are generated locally and contain no markup
+            date_text = paper.formatted_date()
+            if paper.age_days is not None:
+                age_text = f"Days ago: {paper.age_days}"
+            else:
+                age_text = _AGE_UNKNOWN
+
+            yield " " + _CARD_TEMPLATE.format_map(
+                {
+                    "url": url,
+                    "title": title_text,
+                    "journal": journal_text,
+                    "date": date_text,
+                    "age": age_text,
+                    "relevance": paper.relevance,
+                    "authors": authors_text,
+                    "summary": safe_summary,
+                }
+            )
+    yield " </section>"
+
+
+def write_html_report(
+    papers: Sequence[Paper],
+    keywords: Iterable[str],
+    journals: Iterable[str],
+    output_path: Path,
+    options: dict[str, str] | None = None,
+    missing_journals: Sequence[str] | None = None,
+    model: ReportModel | None = None,
+) -> Path:
+    """
+    Generate a minimalist HTML report with clickable cards.
+    """
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    generated = time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime())
+    options = options or {}
+    keywords_list = list(keywords)
+    journals_list = list(journals)
+    keywords_display = ", ".join(f'"{kw}"' for kw in keywords_list)
+
+    hits = frozenset(paper.journal for paper in papers)
+    meta_entries = [
+        f"✦ Keywords: {keywords_display}",
+        f"✦ Days window: {options.get('days', 'n/a')}",
+        f"✦ Limit: {options.get('limit', 'n/a')}",
+        f"✦ Sort: {options.get('sort', 'score')}",
+        f"✦ Coverage: {options.get('coverage', 'all').title()}",
+    ]
+    journal_body = _JOURNAL_SEP.join(
+        f"<span class=\"{'journal-pill hit' if name in hits else 'journal-pill'}\">{escape(name)}</span>"
+        for name in journals_list
+    )
+    journal_label = escape(f"✦ Journals searched ({options.get('journal_count', str(len(journals_list)))})")
+    meta_list = (
+        "".join(f"<li>{escape(item)}</li>" for item in meta_entries)
+        + f"<li>✦ Generated: {escape(generated)}</li>"
+        "<li class=\"journal-block\">"
+        f"<span class=\"journal-block-label\">{journal_label}</span>"
+        f"<div class=\"journal-pill-wrap\">{journal_body}</div>"
+        "</li>"
+    )
+
+    if model is None:
+        model = build_report_model(papers, keywords_list)
+    summary_sections: list[str] = []
+    summary_base_titles = {
+        "full": "Journal summary — full coverage",
+        "near": "Journal summary — near coverage",
+        "partial": "Journal summary — partial coverage",
+        "single": "Journal summary — single keyword",
+        "all": "Journal summary — all coverage levels",
+    }
+    for level in model.groups:
+        rows = model.ascii_lines[level]
+        if not rows:
+            continue
+        summary_body = escape("\n".join(rows))
+        title = f"{summary_base_titles.get(level, level.title())} ({model.descriptors[level]})"
+        summary_sections.append(
+            "<section class=\"summary\">"
+            f"<h2>{escape(title)}</h2>"
+            f"<pre class=\"summary-plot\">{summary_body}</pre>"
+            "</section>"
+        )
+    summary_section = "".join(summary_sections)
+
+    # stream into a sibling file so a failed render never clobbers an old report
+    partial = output_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with partial.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as handle:
+            handle.write(_HEAD_PREFIX)
+            handle.write(_CSS)
+            handle.write(_HEAD_SUFFIX)
+            handle.write(_BODY_OPEN)
+            handle.write(meta_list)
+            handle.write(_HEADER_CLOSE)
+            handle.write(summary_section)
+            handle.write(_SUMMARY_CLOSE)
+            if model.groups:
+                for fragment in _iter_cards(model):
+                    handle.write(fragment)
+            else:
+                handle.write(_NO_RESULTS)
+            handle.write(_BODY_CLOSE)
+        partial.replace(output_path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
     return output_path